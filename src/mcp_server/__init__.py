@@ -1,23 +1,9 @@
-#!/usr/bin/env python3
 """
 Main MCP Server - Composed FastMCP Server
-Combines CMU Dining and Maps services into a single runnable MCP server.
-"""
-from mcp_server.core.app import main_mcp
-from mcp_server.services.eats.app import mcp as eats_mcp
-from mcp_server.services.maps.app import app as maps_mcp
-from mcp_server.services.courses.app import app as courses_mcp
-from mcp_server.services.guide.app import app as guide_mcp
-
-def main():
-    # Mount the subservers with prefixes to avoid naming conflicts
-    main_mcp.mount(eats_mcp, prefix="eats")
-    main_mcp.mount(maps_mcp, prefix="maps")
-    main_mcp.mount(courses_mcp, prefix="courses")
-    main_mcp.mount(guide_mcp, prefix="guide")
+Combines CMU Dining, Maps, Courses and Guide services into a single runnable MCP server.
 
-    # Run the composed MCP server
-    main_mcp.run(transport="http", host="0.0.0.0", port=8000)
+The package itself imports nothing so that `import mcp_server` stays cheap; the composed
+server and its entry point live in mcp_server.main.
+"""
 
-if __name__ == "__main__":
-    main()
+__version__ = "0.1.0"
@@ -1,3 +1,35 @@
+from collections.abc import Awaitable, Callable
+
 from fastmcp import FastMCP
 
-main_mcp = FastMCP(name="Scotty Labs MCPs for CMU", version="0.1.0")
\ No newline at end of file
+main_mcp = FastMCP(name="Scotty Labs MCPs for CMU", version="0.1.0")
+
+# Cleanup for process-wide resources (e.g. pooled HTTP sessions). FastMCP lifespans run per
+# MCP session, so these are instead run once when the HTTP server itself shuts down.
+_shutdown_callbacks: list[Callable[[], Awaitable[None]]] = []
+
+
+def on_shutdown(callback: Callable[[], Awaitable[None]]) -> Callable[[], Awaitable[None]]:
+    """Register an async callback to run when the server shuts down."""
+    _shutdown_callbacks.append(callback)
+    return callback
+
+
+class ShutdownMiddleware:
+    """ASGI middleware that runs the on_shutdown callbacks after the app's lifespan has ended."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "lifespan":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message) -> None:
+            if message["type"] == "lifespan.shutdown.complete":
+                for callback in _shutdown_callbacks:
+                    await callback()
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
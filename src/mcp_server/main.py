@@ -1,19 +1,21 @@
 #!/usr/bin/env python3
 """
 Main MCP Server - Composed FastMCP Server
-Combines CMU Dining and Maps services into a single runnable MCP server.
+Combines CMU Dining, Maps, Courses and Guide services into a single runnable MCP server.
 """
 
 from http import HTTPStatus
 import os
 
 from fastmcp import FastMCP
-from mcp_server.core.app import main_mcp
+from mcp_server.core.app import ShutdownMiddleware, main_mcp
 from mcp_server.services.eats.app import mcp as eats_mcp
 from mcp_server.services.maps.app import app as maps_mcp
 from mcp_server.services.courses.app import app as courses_mcp
 from mcp_server.services.guide.app import app as guide_mcp
 
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
 from starlette.responses import JSONResponse
 
 @main_mcp.custom_route("/api/health", methods=["GET"])
@@ -21,17 +23,53 @@ async def health(request) -> JSONResponse:
     return JSONResponse(content={"status": "ok"}, status_code=HTTPStatus.OK)
 
 
-def main():
+_mounted = False
+
+
+def _mount_once():
+    global _mounted
+    if _mounted:
+        return
     # Mount the subservers with prefixes to avoid naming conflicts
     main_mcp.mount(eats_mcp, prefix="eats")
     main_mcp.mount(maps_mcp, prefix="maps")
     main_mcp.mount(courses_mcp, prefix="courses")
     main_mcp.mount(guide_mcp, prefix="guide")
+    _mounted = True
+
+
+def _http_middleware() -> list[Middleware]:
+    middleware = [Middleware(ShutdownMiddleware)]
+    # Comma-separated browser origins allowed to call the server (e.g. "https://example.com").
+    # Methods and headers are pinned so preflight responses are static and cacheable.
+    allowed_origins = [o.strip() for o in os.environ.get("MCP_ALLOWED_ORIGINS", "").split(",") if o.strip()]
+    if allowed_origins:
+        middleware.append(
+            Middleware(
+                CORSMiddleware,
+                allow_origins=allowed_origins,
+                allow_methods=("GET", "POST", "DELETE", "OPTIONS"),
+                allow_headers=("Authorization", "Content-Type", "Mcp-Session-Id", "Mcp-Protocol-Version"),
+                expose_headers=("Mcp-Session-Id",),
+                allow_credentials=True,
+                max_age=86400,
+            )
+        )
+    return middleware
+
+
+def main():
+    _mount_once()
 
     # Run the composed MCP server
     # main_mcp.run() - attempt deployment
     port = int(os.environ.get("PORT", "5050"))
-    main_mcp.run(transport="http", host="0.0.0.0", port=port)
+    main_mcp.run(
+        transport="http",
+        host="0.0.0.0",
+        port=port,
+        middleware=_http_middleware(),
+    )
 
 if __name__ == "__main__":
     main()
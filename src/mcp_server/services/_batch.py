@@ -0,0 +1,28 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class BatchCall(BaseModel):
+    """One tool invocation inside a batch request."""
+    name: str
+    args: dict[str, Any] = {}
+
+
+async def run_batch(calls: list[BatchCall], handlers: Mapping[str, Callable[..., Awaitable[Any]]]) -> list[Any]:
+    """
+    Run calls concurrently against handlers (tool name -> coroutine function) and return their
+    results in input order. A call that fails yields {"error": ...} instead of failing the batch.
+    """
+    async def run(call: BatchCall) -> Any:
+        handler = handlers.get(call.name)
+        if handler is None:
+            return {"error": f'Unknown tool "{call.name}". Valid names: {", ".join(handlers)}.'}
+        try:
+            return await handler(**call.args)
+        except Exception as e:
+            return {"error": f"{call.name} failed: {e}"}
+
+    return await asyncio.gather(*(run(call) for call in calls))
@@ -0,0 +1,54 @@
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+# key -> (expires_at, value), on the time.monotonic() clock
+_entries: dict[str, tuple[float, Any]] = {}
+_locks: dict[str, asyncio.Lock] = {}
+
+# Keys can come from user input (e.g. map queries), so expired entries and idle locks are swept
+# whenever either table doubles past the entry count after the previous sweep. Checking the lock
+# table too keeps it bounded when loaders keep failing and no entry is ever written.
+_MIN_SWEEP_SIZE = 1024
+_sweep_at = _MIN_SWEEP_SIZE
+
+
+def _sweep(now: float) -> None:
+    global _sweep_at
+    for key in [k for k, (expires_at, _) in _entries.items() if expires_at <= now]:
+        del _entries[key]
+    for key in [k for k, lock in _locks.items() if k not in _entries and not lock.locked()]:
+        del _locks[key]
+    _sweep_at = max(_MIN_SWEEP_SIZE, 2 * len(_entries))
+
+
+def _lookup(key: str) -> tuple[bool, Any]:
+    entry = _entries.get(key)
+    if entry is not None and time.monotonic() < entry[0]:
+        return True, entry[1]
+    return False, None
+
+
+async def cached(key: str, ttl: float, loader: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    Return the value cached under key, calling loader to refill it once it is older than ttl
+    seconds. Concurrent callers for an expired key share a single loader call instead of each
+    hitting the upstream API.
+    """
+    hit, value = _lookup(key)
+    if hit:
+        return value
+    if len(_locks) >= _sweep_at:
+        _sweep(time.monotonic())
+    async with _locks.setdefault(key, asyncio.Lock()):
+        # Another task may have refilled the entry while we waited for the lock.
+        hit, value = _lookup(key)
+        if hit:
+            return value
+        value = await loader()
+        now = time.monotonic()
+        _entries[key] = (now + ttl, value)
+        if len(_entries) >= _sweep_at:
+            _sweep(now)
+        return value
@@ -1,36 +1,94 @@
-import aiohttp
+import httpx
+import orjson
 from fastmcp import FastMCP
 
+from typing import Any
+
+from mcp_server.core.app import on_shutdown
+from mcp_server.services._batch import BatchCall, run_batch
+from mcp_server.services._cache import cached
+
 BASE_URL = "https://course-tools.apis.scottylabs.org"
-TIMEOUT = aiohttp.ClientTimeout(total=10)
+COURSES_CACHE_TTL_SECONDS = 60 * 60  # 1h, full course list only
+GENEDS_CACHE_TTL_SECONDS = 60 * 60  # 1h, anonymous (non-token) requests only
+COURSE_SCHEDULES_CACHE_TTL_SECONDS = 5  # just long enough to share one fetch across paired tool calls
 
 app = FastMCP("cmucourses-proxy")
 
+# Shared across all tool calls so connections are reused; HTTP/2 lets concurrent calls
+# multiplex over a single connection.
+_client: httpx.AsyncClient | None = None
+
 # --- Internal HTTP helpers ---
+async def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=10.0,
+            http2=True,
+            verify=False,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+    return _client
+
+@on_shutdown
+async def _close_client() -> None:
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+
 async def _get_http(path: str, params: dict | None = None) -> dict:
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-        async with session.get(f"{BASE_URL}{path}", params=params, ssl=False) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    client = await _get_client()
+    resp = await client.get(path, params=params)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 async def _post_http(path: str, data: dict | None = None) -> dict:
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-        async with session.post(f"{BASE_URL}{path}", json=data, ssl=False) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    client = await _get_client()
+    resp = await client.post(path, json=data)
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
 
 # --- Internal helpers for per-course data ---
+async def _get_courses_with_schedules(course_id: str) -> list[dict]:
+    # The full /courses response list for one course ID, shared by the instructors and schedules
+    # helpers. The short-lived cache also coalesces concurrent calls for the same course into a
+    # single request.
+    return await cached(
+        f"course:{course_id}:schedules",
+        COURSE_SCHEDULES_CACHE_TTL_SECONDS,
+        lambda: _get_courses(course_ids=[course_id], schedules=True),
+    )
+
 async def _get_instructors_for_course(course_id: str) -> list[str]:
-    course_data = await _get_courses(course_ids=[course_id], schedules=True)
-    instructors = []
+    course_data = await _get_courses_with_schedules(course_id)
+    seen: set[str] = set()
+    for course in course_data:
+        for sched in course.get("schedules", ()):
+            instructor = sched.get("instructor")
+            if instructor is not None:
+                seen.add(instructor)
+    return list(seen)
+
+async def _get_instructors_for_courses(course_ids: list[str]) -> dict[str, list[str]]:
+    # One /courses request for all IDs, then group instructors by course in a single pass.
+    if not course_ids:
+        # _get_courses would treat an empty list as "every course"
+        return {}
+    course_data = await _get_courses(course_ids=course_ids, schedules=True)
+    instructors: dict[str, set[str]] = {course_id: set() for course_id in course_ids}
     for course in course_data:
-        for sched in course.get("schedules", []):
-            if "instructor" in sched:
-                instructors.append(sched["instructor"])
-    return list(set(instructors))
+        seen = instructors.get(course.get("courseID"))
+        if seen is None:  # missing or unrequested ID; keep the result keyed by requested IDs only
+            continue
+        for sched in course.get("schedules", ()):
+            instructor = sched.get("instructor")
+            if instructor is not None:
+                seen.add(instructor)
+    return {course_id: list(names) for course_id, names in instructors.items()}
 
 async def _get_schedules_for_course(course_id: str) -> list[dict]:
-    course_data = await _get_courses(course_ids=[course_id], schedules=True)
+    course_data = await _get_courses_with_schedules(course_id)
     if course_data and "schedules" in course_data[0]:
         return course_data[0]["schedules"]
     return []
@@ -42,6 +100,10 @@ async def _get_courses(course_ids: list[str] | None = None, schedules: bool = Fa
         params["courseID"] = course_ids
     if schedules:
         params["schedules"] = "true"
+    if not course_ids:
+        return await cached(
+            f"courses:all:{schedules}", COURSES_CACHE_TTL_SECONDS, lambda: _get_http("/courses", params=params)
+        )
     return await _get_http("/courses", params=params)
 
 async def _get_course(course_id: str) -> dict:
@@ -62,7 +124,8 @@ async def _search_courses(query: str) -> list[dict]:
 async def _get_geneds(school: str | None = None, user_token: str | None = None) -> list[dict]:
     """
     Fetch general education requirements. Supports optional school query param (e.g., "SCS").
-    If user_token provided, does POST, else GET.
+    If user_token provided, does POST, else GET. GET results are cached since they are the same
+    for every user.
     """
     if user_token and user_token.strip():
         data = {"token": user_token}
@@ -73,7 +136,9 @@ async def _get_geneds(school: str | None = None, user_token: str | None = None)
         params = {}
         if school:
             params["school"] = school
-        return await _get_http("/geneds", params=params)
+        return await cached(
+            f"geneds:{school or ''}", GENEDS_CACHE_TTL_SECONDS, lambda: _get_http("/geneds", params=params)
+        )
 
 async def _get_geneds_for_department(department: str, school: str | None = None, user_token: str | None = None) -> list[dict]:
     """
@@ -115,6 +180,12 @@ async def fetch_course_instructors(course_id: str) -> list[str]:
     """Fetch all instructors for a CMU course by its ID (exact match)."""
     return await _get_instructors_for_course(course_id)
 
+@app.tool()
+async def fetch_course_instructors_bulk(course_ids: list[str]) -> dict[str, list[str]]:
+    """Fetch instructors for several CMU courses in one request, keyed by course ID
+    (exact match, e.g. ["15-122", "15-213"]). Prefer this over repeated fetch_course_instructors calls."""
+    return await _get_instructors_for_courses(course_ids)
+
 @app.tool()
 async def fetch_course_schedules(course_id: str) -> list[dict]:
     """Fetch all schedules/times for a CMU course by its ID (exact match)."""
@@ -137,6 +208,31 @@ async def fetch_geneds_for_department_tool(department: str, school: str | None =
     return await _get_geneds_for_department(department=department, school=school, user_token=user_token)
 
 
+# Tool name -> internal helper, so batched calls skip the per-tool MCP wrapper.
+_BATCH_HANDLERS = {
+    "fetch_course_by_id": _get_course,
+    "fetch_courses_by_ids": _get_courses,
+    "fetch_course_requisites": _get_requisites,
+    "search_courses_by_query": _search_courses,
+    "fetch_course_instructors": _get_instructors_for_course,
+    "fetch_course_instructors_bulk": _get_instructors_for_courses,
+    "fetch_course_schedules": _get_schedules_for_course,
+    "fetch_geneds_tool": _get_geneds,
+    "fetch_geneds_for_department_tool": _get_geneds_for_department,
+}
+
+@app.tool()
+async def batch(calls: list[BatchCall]) -> list[Any]:
+    """
+    Run several of this server's tools concurrently in one call, e.g.
+    [{"name": "fetch_course_by_id", "args": {"course_id": "15-122"}},
+     {"name": "fetch_course_requisites", "args": {"course_id": "15-213"}}].
+    Names are the tool names without the server prefix. Results come back in input order;
+    a failed call yields {"error": ...} instead of failing the whole batch.
+    """
+    return await run_batch(calls, _BATCH_HANDLERS)
+
+
 # --- Run server ---
 if __name__ == "__main__":
     app.run()
@@ -4,12 +4,19 @@ FastMCP Server for CMU Dining Locations
 Provides tools to query Carnegie Mellon University dining locations, hours, and availability.
 """
 
+import time
 from datetime import datetime, timedelta
+from typing import Any
+
 from fastmcp import FastMCP
 
+from mcp_server.services._batch import BatchCall, run_batch
+from mcp_server.services._cache import cached
+from mcp_server.services.eats.constants import DAYS, OPEN_NOW_CACHE_TTL_SECONDS
+
 from mcp_server.services.eats.utils import (
-    fetch_locations, is_location_open_now, format_times_for_display,
-    format_locations_list_markdown, format_location_markdown
+    fetch_locations, fetch_location_index, current_timestamp_ms, is_open_at, format_times_for_display,
+    format_locations_list_markdown, format_location_markdown, parse_time_slots
 )
 
 # Initialize FastMCP server
@@ -38,12 +45,13 @@ async def search_dining_locations(name_query: str) -> str:
     Returns locations that match the search query formatted as clean markdown.
     """
     # Fetch all locations and filter locally since the new API returns all locations
-    raw_locations = await fetch_locations()
-    
+    index = await fetch_location_index()
+    query_lower = name_query.lower()
+
     # Filter locations by name query
     matching_locations = [
-        loc for loc in raw_locations 
-        if name_query.lower() in loc.get("name", "").lower()
+        loc for loc, name in zip(index.locations, index.names)
+        if query_lower in name
     ]
     
     if not matching_locations:
@@ -59,13 +67,16 @@ async def get_locations_open_now() -> str:
     Returns a formatted list of locations that are open right now based on current day and time.
     Locations are grouped by cuisine type for easy browsing.
     """
-    raw_locations = await fetch_locations()
-    
+    # Bursts of calls share one rendered result. Keying on the epoch minute means it is never
+    # served past the current wall-clock minute, however long the render took.
+    minute_id = int(time.time()) // 60
+    return await cached(f"eats:open_now:{minute_id}", OPEN_NOW_CACHE_TTL_SECONDS, _render_locations_open_now)
+
+async def _render_locations_open_now() -> str:
+    index = await fetch_location_index()
+
     # Filter to only open locations
-    open_locations = [
-        loc for loc in raw_locations 
-        if is_location_open_now(loc.get("times", []))
-    ]
+    open_locations = index.open_at(current_timestamp_ms())
     
     if not open_locations:
         return "# Currently Open Locations\n\nNo dining locations are currently open."
@@ -85,17 +96,15 @@ async def get_locations_open_at_time(day: int, hour: int, minute: int = 0) -> st
     Returns locations that are open at the specified time formatted as clean markdown,
     grouped by cuisine type for easy browsing.
     """
-    if not (0 <= day <= 6):
-        raise ValueError("Day must be between 0 (Sunday) and 6 (Saturday)")
-    if not (0 <= hour <= 23):
-        raise ValueError("Hour must be between 0 and 23")
-    if not (0 <= minute <= 59):
-        raise ValueError("Minute must be between 0 and 59")
-
-    days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
+    if (day | hour | minute) < 0 or day > 6 or hour > 23 or minute > 59:
+        raise ValueError(
+            "Day must be between 0 (Sunday) and 6 (Saturday), hour between 0 and 23, "
+            "and minute between 0 and 59"
+        )
+
     time_str = f"{hour:02d}:{minute:02d}"
 
-    raw_locations = await fetch_locations()
+    index = await fetch_location_index()
     
     # Calculate target timestamp for the specified day/time
     now = datetime.now()
@@ -109,20 +118,12 @@ async def get_locations_open_at_time(day: int, hour: int, minute: int = 0) -> st
     target_timestamp_ms = int(target_dt.timestamp() * 1000)
     
     # Filter locations open at the specified time
-    open_locations = []
-    for loc in raw_locations:
-        times = loc.get("times", [])
-        for time_slot in times:
-            start_ms = time_slot.get("start", 0)
-            end_ms = time_slot.get("end", 0)
-            if start_ms <= target_timestamp_ms < end_ms:
-                open_locations.append(loc)
-                break
+    open_locations = index.open_at(target_timestamp_ms)
     
     if not open_locations:
-        return f"# Locations Open on {days[day]} at {time_str}\n\nNo dining locations are open at this time."
+        return f"# Locations Open on {DAYS[day]} at {time_str}\n\nNo dining locations are open at this time."
 
-    return format_locations_list_markdown(open_locations, f"Locations Open on {days[day]} at {time_str}")
+    return format_locations_list_markdown(open_locations, f"Locations Open on {DAYS[day]} at {time_str}")
 
 @mcp.tool()
 async def get_location_hours(location_name: str) -> str:
@@ -134,42 +135,40 @@ async def get_location_hours(location_name: str) -> str:
 
     Returns detailed information including hours, current status, and specials for the location.
     """
-    raw_locations = await fetch_locations()
+    index = await fetch_location_index()
+    query_lower = location_name.lower()
 
     # Find matching location
     matching_location = None
-    for location in raw_locations:
-        if location_name.lower() in location.get("name", "").lower():
+    for location, name in zip(index.locations, index.names):
+        if query_lower in name:
             matching_location = location
             break
 
     if not matching_location:
         return f"# Location Search\n\nNo location found matching '{location_name}'. Please check the name and try again."
 
-    is_open = is_location_open_now(matching_location.get("times", []))
+    # Parse the times once for the open check, the summary and the detailed hours
+    slots = parse_time_slots(matching_location.get("times", []))
+    is_open = is_open_at(slots, current_timestamp_ms())
     status = "open" if is_open else "closed"
 
     # Format the single location
-    location_md = format_location_markdown(matching_location, status)
+    parts = ["# Location Details\n\n", format_location_markdown(matching_location, status, slots=slots)]
 
     # Add today's specials if available
     specials = matching_location.get("todaysSpecials", [])
     if specials:
-        specials_text = "\n**Today's Specials:**\n"
-        for special in specials:
-            title = special.get("title", "")
-            description = special.get("description", "")
-            specials_text += f"- **{title}**: {description}\n"
-        location_md += specials_text
+        parts.append("\n**Today's Specials:**\n")
+        parts.extend(f"- **{s.get('title', '')}**: {s.get('description', '')}\n" for s in specials)
 
     # Add detailed hours
-    detailed_hours = format_times_for_display(matching_location.get("times", []))
+    detailed_hours = format_times_for_display(slots)
     if detailed_hours:
-        location_md += "\n**Detailed Hours:**\n"
-        for hour_info in detailed_hours:
-            location_md += f"- {hour_info}\n"
+        parts.append("\n**Detailed Hours:**\n")
+        parts.extend(f"- {hour_info}\n" for hour_info in detailed_hours)
 
-    return f"# Location Details\n\n{location_md}"
+    return "".join(parts)
 
 @mcp.tool()
 async def get_locations_by_cuisine(cuisine_query: str) -> str:
@@ -181,27 +180,40 @@ async def get_locations_by_cuisine(cuisine_query: str) -> str:
 
     Returns locations that serve the specified type of cuisine formatted as clean markdown.
     """
-    raw_locations = await fetch_locations()
-    matching_locations = []
-
+    index = await fetch_location_index()
     cuisine_lower = cuisine_query.lower()
 
-    for raw_location in raw_locations:
-        name = raw_location.get("name", "").lower()
-        short_desc = raw_location.get("shortDescription", "").lower()
-        description = raw_location.get("description", "").lower()
-
-        # Search in name, short description, and full description
-        if (cuisine_lower in name or
-            cuisine_lower in short_desc or
-            cuisine_lower in description):
-            matching_locations.append(raw_location)
+    # Search in name, short description, and full description (pre-joined and lowercased in the index)
+    matching_locations = [
+        raw_location for raw_location, haystack in zip(index.locations, index.haystacks)
+        if cuisine_lower in haystack
+    ]
 
     if not matching_locations:
         return f"# Cuisine Search for '{cuisine_query}'\n\nNo dining locations found serving '{cuisine_query}' cuisine."
 
     return format_locations_list_markdown(matching_locations, f"Locations Serving '{cuisine_query.title()}' Cuisine")
 
+# Tool name -> underlying function, so batched calls skip the per-tool MCP wrapper.
+_BATCH_HANDLERS = {
+    tool.name: tool.fn
+    for tool in (
+        get_all_dining_locations, search_dining_locations, get_locations_open_now,
+        get_locations_open_at_time, get_location_hours, get_locations_by_cuisine,
+    )
+}
+
+@mcp.tool()
+async def batch(calls: list[BatchCall]) -> list[Any]:
+    """
+    Run several of this server's tools concurrently in one call, e.g.
+    [{"name": "get_location_hours", "args": {"location_name": "Tahini"}},
+     {"name": "get_locations_by_cuisine", "args": {"cuisine_query": "coffee"}}].
+    Names are the tool names without the server prefix. Results come back in input order;
+    a failed call yields {"error": ...} instead of failing the whole batch.
+    """
+    return await run_batch(calls, _BATCH_HANDLERS)
+
 if __name__ == "__main__":
     # Run the MCP server
     mcp.run()
\ No newline at end of file
@@ -1,2 +1,7 @@
 # Configuration
-API_BASE_URL = "https://api.cmueats.com/v2/locations"
\ No newline at end of file
+API_BASE_URL = "https://api.cmueats.com/v2/locations"
+LOCATIONS_CACHE_TTL_SECONDS = 30
+OPEN_NOW_CACHE_TTL_SECONDS = 30
+
+# Day names in API order (0=Sunday)
+DAYS = ("Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday")
\ No newline at end of file
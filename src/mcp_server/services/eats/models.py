@@ -1,22 +1,27 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
 
 class DiningLocation(BaseModel):
     """Represents a CMU dining location with relevant information for users."""
-    concept_id: int
-    name: str
-    short_description: str
-    description: str
-    location: str
-    accepts_online_orders: bool
+    # Validates straight from raw API dicts via the camelCase aliases; unknown keys are dropped.
+    model_config = ConfigDict(frozen=True, extra="ignore", populate_by_name=True)
+
+    concept_id: int = Field(default=0, alias="conceptId")
+    name: str = ""
+    short_description: str = Field(default="", alias="shortDescription")
+    description: str = ""
+    location: str = ""
+    accepts_online_orders: bool = Field(default=False, alias="acceptsOnlineOrders")
     url: Optional[str] = None
-    menu_url: Optional[str] = None
+    menu_url: Optional[str] = Field(default=None, alias="menu")
     current_status: str = "unknown"  # open, closed, unknown
 
 class TimeSlot(BaseModel):
     """Represents operating hours for a location."""
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     day: int  # 0=Sunday, 1=Monday, etc.
     start_hour: int
     start_minute: int
     end_hour: int 
-    end_minute: int
\ No newline at end of file
+    end_minute: int
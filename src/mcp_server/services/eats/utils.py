@@ -1,34 +1,129 @@
+import functools
+import re
 import httpx
-from typing import List, Dict, Any
+import orjson
+from dataclasses import dataclass
+from typing import List, Dict, Any, NamedTuple
 from datetime import datetime
 
-from mcp_server.services.eats.constants import API_BASE_URL
+from mcp_server.core.app import on_shutdown
+from mcp_server.services._cache import cached
+from mcp_server.services.eats.constants import API_BASE_URL, DAYS, LOCATIONS_CACHE_TTL_SECONDS
 from mcp_server.services.eats.models import DiningLocation
 
+# Shared across all tool calls so keep-alive connections to the dining API are reused.
+_client: httpx.AsyncClient | None = None
+
+@dataclass(frozen=True)
+class LocationIndex:
+    """Raw locations plus parallel tuples of their lowercased search fields, built once per fetch.
+
+    haystacks joins name, short description and description with a NUL separator so a single
+    substring test covers all three without matches spanning two fields.
+
+    slot_starts, slot_ends and slot_owners flatten every location's time slots into parallel
+    tuples (owner = index into locations), so an "open at" check is one scan over plain ints.
+    """
+    locations: List[Dict[str, Any]]
+    names: tuple[str, ...]
+    haystacks: tuple[str, ...]
+    slot_starts: tuple[int, ...]
+    slot_ends: tuple[int, ...]
+    slot_owners: tuple[int, ...]
+
+    def open_at(self, timestamp_ms: int) -> List[Dict[str, Any]]:
+        """Locations with a time slot covering timestamp_ms, in API order."""
+        open_ids = {
+            owner for start_ms, end_ms, owner in zip(self.slot_starts, self.slot_ends, self.slot_owners)
+            if start_ms <= timestamp_ms < end_ms
+        }
+        return [self.locations[i] for i in sorted(open_ids)]
+
+# Conditional request headers (If-None-Match / If-Modified-Since) from the last full response,
+# and the index built from it. Once the TTL cache expires, a refresh that comes back
+# 304 Not Modified reuses the index instead of downloading and decoding the payload again.
+_revalidation_headers: Dict[str, str] = {}
+_last_index: LocationIndex | None = None
+
+async def _get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0),
+        )
+    return _client
+
+@on_shutdown
+async def _close_client() -> None:
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+
 async def fetch_locations() -> List[Dict[str, Any]]:
-    """Fetch all dining locations from the API."""
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(API_BASE_URL)
-            response.raise_for_status()
-            data = response.json()
-            # API returns array directly
-            return data if isinstance(data, list) else []
-        except Exception as e:
-            raise Exception(f"Failed to fetch dining locations: {str(e)}")
+    """Fetch all dining locations, cached for LOCATIONS_CACHE_TTL_SECONDS."""
+    return (await fetch_location_index()).locations
+
+async def fetch_location_index() -> LocationIndex:
+    """Fetch all dining locations along with their search index, cached for LOCATIONS_CACHE_TTL_SECONDS."""
+    return await cached("eats:locations", LOCATIONS_CACHE_TTL_SECONDS, _load_location_index)
+
+async def _load_location_index() -> LocationIndex:
+    global _last_index, _revalidation_headers
+    fetched = await _fetch_locations_http(revalidate=_last_index is not None)
+    if fetched is None:
+        return _last_index
+    locations, validators = fetched
+    slots = [
+        (time_slot.get("start", 0), time_slot.get("end", 0), owner)
+        for owner, loc in enumerate(locations)
+        for time_slot in loc.get("times") or ()
+    ]
+    slot_starts, slot_ends, slot_owners = zip(*slots) if slots else ((), (), ())
+    _last_index = LocationIndex(
+        locations=locations,
+        names=tuple(loc.get("name", "").lower() for loc in locations),
+        haystacks=tuple(
+            f"{loc.get('name', '')}\x00{loc.get('shortDescription', '')}\x00{loc.get('description', '')}".lower()
+            for loc in locations
+        ),
+        slot_starts=slot_starts,
+        slot_ends=slot_ends,
+        slot_owners=slot_owners,
+    )
+    # Only adopt the new validators once their data is indexed, so a later 304 never pairs
+    # them with an older index
+    _revalidation_headers = validators
+    return _last_index
+
+async def _fetch_locations_http(revalidate: bool = False) -> tuple[List[Dict[str, Any]], Dict[str, str]] | None:
+    """Fetch all dining locations from the API, along with the conditional request headers
+    to revalidate them with later.
+
+    With revalidate, sends the validators from the previous response and returns None if the
+    API reports the data as unchanged.
+    """
+    client = await _get_client()
+    # httpx errors propagate as-is so callers can tell timeouts from bad responses
+    response = await client.get(API_BASE_URL, headers=_revalidation_headers if revalidate else None)
+    if response.status_code == httpx.codes.NOT_MODIFIED:
+        return None
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    validators = {
+        request_header: response.headers[response_header]
+        for request_header, response_header in (("If-None-Match", "ETag"), ("If-Modified-Since", "Last-Modified"))
+        if response_header in response.headers
+    }
+    # API returns array directly; also accept a {"locations": [...]} envelope
+    if isinstance(data, dict):
+        return data.get("locations", []) or [], validators
+    return (data if isinstance(data, list) else []), validators
 
 def parse_location_data(raw_location: Dict[str, Any]) -> DiningLocation:
     """Convert raw API location data to DiningLocation model."""
-    return DiningLocation(
-        concept_id=raw_location.get("conceptId", 0),
-        name=raw_location.get("name", ""),
-        short_description=raw_location.get("shortDescription", ""),
-        description=raw_location.get("description", ""),
-        location=raw_location.get("location", ""),
-        accepts_online_orders=raw_location.get("acceptsOnlineOrders", False),
-        url=raw_location.get("url"),
-        menu_url=raw_location.get("menu")
-    )
+    return DiningLocation.model_validate(raw_location)
 
 def get_current_day_and_time() -> tuple[int, int, int]:
     """Get current day (0=Sunday) and time (hour, minute)."""
@@ -37,41 +132,40 @@ def get_current_day_and_time() -> tuple[int, int, int]:
     day = (now.weekday() + 1) % 7
     return day, now.hour, now.minute
 
-def is_location_open_now(location_times: List[Dict[str, Any]]) -> bool:
-    """Check if a location is currently open based on its times.
-    
-    Times are now Unix timestamps in milliseconds.
+def current_timestamp_ms() -> int:
+    """Get the current time as a Unix timestamp in milliseconds."""
+    return int(datetime.now().timestamp() * 1000)
+
+class ParsedTimeSlot(NamedTuple):
+    """A time slot with its Unix millisecond bounds and their local datetimes."""
+    start_ms: int
+    end_ms: int
+    start: datetime
+    end: datetime
+
+def parse_time_slots(location_times: List[Dict[str, Any]] | None) -> List[ParsedTimeSlot]:
+    """Parse a location's raw times once so the display helpers don't redo the lookups and conversions.
+
+    The API may send "times": null, which parses to no slots.
     """
-    if not location_times:
-        return False
-    
-    now = datetime.now()
-    current_timestamp_ms = int(now.timestamp() * 1000)
-    
-    for time_slot in location_times:
+    slots = []
+    for time_slot in location_times or ():
         start_ms = time_slot.get("start", 0)
         end_ms = time_slot.get("end", 0)
-        
-        if start_ms <= current_timestamp_ms < end_ms:
-            return True
-    
-    return False
-
-def format_times_for_display(location_times: List[Dict[str, Any]]) -> List[str]:
-    """Format location times for human-readable display.
-    
-    Times are now Unix timestamps in milliseconds.
-    """
+        slots.append(ParsedTimeSlot(
+            start_ms, end_ms, datetime.fromtimestamp(start_ms / 1000), datetime.fromtimestamp(end_ms / 1000)
+        ))
+    return slots
+
+def is_open_at(slots: List[ParsedTimeSlot], timestamp_ms: int) -> bool:
+    """Check if any parsed slot covers timestamp_ms."""
+    return any(slot.start_ms <= timestamp_ms < slot.end_ms for slot in slots)
+
+def format_times_for_display(slots: List[ParsedTimeSlot]) -> List[str]:
+    """Format parsed location times for human-readable display."""
     formatted_times = []
 
-    for time_slot in location_times:
-        start_ms = time_slot.get("start", 0)
-        end_ms = time_slot.get("end", 0)
-        
-        # Convert milliseconds to datetime
-        start_dt = datetime.fromtimestamp(start_ms / 1000)
-        end_dt = datetime.fromtimestamp(end_ms / 1000)
-        
+    for _, _, start_dt, end_dt in slots:
         day_name = start_dt.strftime("%A")
         start_time = start_dt.strftime("%H:%M")
         end_time = end_dt.strftime("%H:%M")
@@ -80,8 +174,7 @@ def format_times_for_display(location_times: List[Dict[str, Any]]) -> List[str]:
 
     return formatted_times
 
-def format_time_12_hour(hour: int, minute: int) -> str:
-    """Convert 24-hour time to 12-hour format with AM/PM."""
+def _format_time_12_hour(hour: int, minute: int) -> str:
     if hour == 0:
         return f"12:{minute:02d} AM"
     elif hour < 12:
@@ -91,26 +184,48 @@ def format_time_12_hour(hour: int, minute: int) -> str:
     else:
         return f"{hour - 12}:{minute:02d} PM"
 
-def group_consecutive_days(location_times: List[Dict[str, Any]]) -> str:
-    """Group consecutive days with same hours for compact display.
-    
-    Times are now Unix timestamps in milliseconds.
-    """
-    if not location_times:
-        return "Hours not available"
+# Every minute of the day pre-formatted, indexed by hour * 60 + minute
+_TIME_12_HOUR = tuple(_format_time_12_hour(h, m) for h in range(24) for m in range(60))
 
-    days = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
-    day_groups = {}
+def format_time_12_hour(hour: int, minute: int) -> str:
+    """Convert 24-hour time to 12-hour format with AM/PM."""
+    return _TIME_12_HOUR[hour * 60 + minute]
+
+# Day bitmasks (bit 0 = Sunday) with a dedicated label
+_DAY_MASK_LABELS = {
+    0b1111111: "Daily",
+    0b0111110: "Monday - Friday",
+    0b1000001: "Saturday - Sunday",
+}
+
+def _format_day_mask(mask: int) -> str:
+    """Format a day bitmask as runs of consecutive days, e.g. "Monday - Wednesday, Friday"."""
+    label = _DAY_MASK_LABELS.get(mask)
+    if label is not None:
+        return label
+
+    runs = []
+    i = 0
+    while i < 7:
+        if mask >> i & 1:
+            j = i
+            while j < 7 and mask >> j & 1:
+                j += 1
+            runs.append(DAYS[i] if j - i == 1 else f"{DAYS[i]} - {DAYS[j - 1]}")
+            i = j
+        else:
+            i += 1
+    return ", ".join(runs)
 
-    # Group times by their start-end pattern
-    for time_slot in location_times:
-        start_ms = time_slot.get("start", 0)
-        end_ms = time_slot.get("end", 0)
-        
-        # Convert milliseconds to datetime
-        start_dt = datetime.fromtimestamp(start_ms / 1000)
-        end_dt = datetime.fromtimestamp(end_ms / 1000)
+def group_consecutive_days(slots: List[ParsedTimeSlot]) -> str:
+    """Group consecutive days with same hours for compact display."""
+    if not slots:
+        return "Hours not available"
+
+    # Bitmask of days per start-end pattern, in order of first appearance
+    day_masks: Dict[str, int] = {}
 
+    for _, _, start_dt, end_dt in slots:
         start_time = format_time_12_hour(start_dt.hour, start_dt.minute)
         end_time = format_time_12_hour(end_dt.hour, end_dt.minute)
         time_range = f"{start_time} - {end_time}"
@@ -119,92 +234,78 @@ def group_consecutive_days(location_times: List[Dict[str, Any]]) -> str:
         # Python weekday: 0=Monday, so we convert
         day_idx = (start_dt.weekday() + 1) % 7
 
-        if time_range not in day_groups:
-            day_groups[time_range] = []
-        day_groups[time_range].append(day_idx)
-
-    # Format grouped days
-    formatted_groups = []
-    for time_range, day_indices in day_groups.items():
-        day_indices.sort()
-        day_names = [days[i] for i in day_indices]
-
-        # Group consecutive days
-        if len(day_names) == 1:
-            days_str = day_names[0]
-        elif len(day_names) == 7:
-            days_str = "Daily"
-        elif day_indices == [1, 2, 3, 4, 5]:  # Monday-Friday
-            days_str = "Monday - Friday"
-        elif day_indices == [0, 6]:  # Weekend
-            days_str = "Saturday - Sunday"
-        else:
-            # Handle other groupings
-            consecutive_groups = []
-            current_group = [day_names[0]]
-
-            for i in range(1, len(day_names)):
-                if day_indices[i] == day_indices[i-1] + 1:
-                    current_group.append(day_names[i])
-                else:
-                    if len(current_group) > 1:
-                        consecutive_groups.append(f"{current_group[0]} - {current_group[-1]}")
-                    else:
-                        consecutive_groups.append(current_group[0])
-                    current_group = [day_names[i]]
-
-            if len(current_group) > 1:
-                consecutive_groups.append(f"{current_group[0]} - {current_group[-1]}")
-            else:
-                consecutive_groups.append(current_group[0])
-
-            days_str = ", ".join(consecutive_groups)
-
-        formatted_groups.append(f"{days_str}: {time_range}")
-
-    return " | ".join(formatted_groups)
-
+        day_masks[time_range] = day_masks.get(time_range, 0) | (1 << day_idx)
+
+    return " | ".join(f"{_format_day_mask(mask)}: {time_range}" for time_range, mask in day_masks.items())
+
+# Checked in order; the first cuisine with a matching keyword wins.
+_CUISINE_KEYWORDS = {
+    "coffee": ["coffee", "espresso", "latte", "cappuccino", "cafe", "prima"],
+    "asian": ["asian", "chinese", "hunan", "sushi", "noodle", "rice bowl", "boba", "tea"],
+    "mexican": ["mexican", "taco", "burrito", "quesadilla", "gallo", "taqueria"],
+    "mediterranean": ["mediterranean", "tahini", "shawarma", "falafel", "hummus", "gyros"],
+    "italian": ["italian", "pasta", "pizza", "ciao bella"],
+    "indian": ["india", "curry", "tandoori"],
+    "american": ["burger", "grill", "deli", "sandwich", "fries"],
+    "hawaiian": ["hawaiian", "poke", "ola ola", "loco moco"],
+    "dessert": ["ice cream", "dessert", "milkshake", "creamery"],
+    "healthy": ["salad", "smoothie", "acai", "protein", "nourish"]
+}
+
+# One compiled alternation per cuisine, so each is a single C-level scan of the text
+_CUISINE_PATTERNS = [
+    (cuisine.title(), re.compile("|".join(map(re.escape, keywords))))
+    for cuisine, keywords in _CUISINE_KEYWORDS.items()
+]
+
+@functools.lru_cache(maxsize=1024)
 def extract_cuisine_type(name: str, description: str) -> str:
     """Extract cuisine type from location name and description."""
-    name_lower = name.lower()
-    desc_lower = description.lower()
-
-    cuisine_keywords = {
-        "coffee": ["coffee", "espresso", "latte", "cappuccino", "cafe", "prima"],
-        "asian": ["asian", "chinese", "hunan", "sushi", "noodle", "rice bowl", "boba", "tea"],
-        "mexican": ["mexican", "taco", "burrito", "quesadilla", "gallo", "taqueria"],
-        "mediterranean": ["mediterranean", "tahini", "shawarma", "falafel", "hummus", "gyros"],
-        "italian": ["italian", "pasta", "pizza", "ciao bella"],
-        "indian": ["india", "curry", "tandoori"],
-        "american": ["burger", "grill", "deli", "sandwich", "fries"],
-        "hawaiian": ["hawaiian", "poke", "ola ola", "loco moco"],
-        "dessert": ["ice cream", "dessert", "milkshake", "creamery"],
-        "healthy": ["salad", "smoothie", "acai", "protein", "nourish"]
-    }
+    # Newline-joined so a keyword can't match across the name/description boundary
+    haystack = f"{name}\n{description}".lower()
 
-    for cuisine, keywords in cuisine_keywords.items():
-        if any(keyword in name_lower or keyword in desc_lower for keyword in keywords):
-            return cuisine.title()
+    for cuisine, pattern in _CUISINE_PATTERNS:
+        if pattern.search(haystack):
+            return cuisine
 
     return "Dining"
 
-def format_location_markdown(location_data: Dict[str, Any], current_status: str = "unknown") -> str:
-    """Format a single location as clean markdown."""
+# Status indicator per current_status; anything else renders as unknown
+_STATUS_EMOJI = {"open": "🟢", "closed": "🔴"}
+
+def format_location_markdown(
+    location_data: Dict[str, Any],
+    current_status: str = "unknown",
+    cuisine: str | None = None,
+    slots: List[ParsedTimeSlot] | None = None,
+) -> str:
+    """Format a single location as clean markdown. Pass cuisine and parsed slots if the caller already has them."""
+    return "\n".join(_location_markdown_lines(location_data, current_status, cuisine, slots)) + "\n"
+
+def _location_markdown_lines(
+    location_data: Dict[str, Any],
+    current_status: str = "unknown",
+    cuisine: str | None = None,
+    slots: List[ParsedTimeSlot] | None = None,
+) -> List[str]:
+    """Markdown lines for a single location, without trailing newlines, for callers building larger documents."""
     name = location_data.get("name", "Unknown")
     short_desc = location_data.get("shortDescription", "")
     description = location_data.get("description", "")
     location = location_data.get("location", "Location not specified")
     accepts_online = location_data.get("acceptsOnlineOrders", False)
-    times = location_data.get("times", [])
 
     # Extract cuisine type
-    cuisine = extract_cuisine_type(name, description)
+    if cuisine is None:
+        cuisine = extract_cuisine_type(name, description)
 
     # Format hours
-    hours = group_consecutive_days(times)
+    if slots is None:
+        slots = parse_time_slots(location_data.get("times", []))
+    hours = group_consecutive_days(slots)
 
     # Status indicator
-    status_emoji = "🟢" if current_status == "open" else "🔴" if current_status == "closed" else "⚪"
+    status_emoji = _STATUS_EMOJI.get(current_status, "⚪")
 
     # Online ordering indicator
     online_emoji = "📱" if accepts_online else ""
@@ -214,37 +315,37 @@ def format_location_markdown(location_data: Dict[str, Any], current_status: str
     if len(clean_desc) > 150:
         clean_desc = clean_desc[:147] + "..."
 
-    markdown = f"""### {status_emoji} {name} {online_emoji}
-**Cuisine:** {cuisine}
-**Location:** {location}
-**Hours:** {hours}
-**Description:** {clean_desc}
-"""
-
-    return markdown
+    return [
+        f"### {status_emoji} {name} {online_emoji}",
+        f"**Cuisine:** {cuisine}",
+        f"**Location:** {location}",
+        f"**Hours:** {hours}",
+        f"**Description:** {clean_desc}",
+    ]
 
 def format_locations_list_markdown(locations_data: List[Dict[str, Any]], title: str = "Dining Locations") -> str:
     """Format multiple locations as a clean markdown list grouped by cuisine."""
     if not locations_data:
         return f"# {title}\n\nNo locations found."
 
-    # Group locations by cuisine type
-    cuisine_groups = {}
-    for location in locations_data:
-        name = location.get("name", "Unknown")
-        description = location.get("description", "")
-        cuisine = extract_cuisine_type(name, description)
+    now_ms = current_timestamp_ms()
 
-        if cuisine not in cuisine_groups:
-            cuisine_groups[cuisine] = []
-        cuisine_groups[cuisine].append(location)
+    # Group locations by cuisine type in a single pass that also parses their times and
+    # settles their open status, so rendering below reuses both
+    cuisine_groups: Dict[str, List[tuple[Dict[str, Any], List[ParsedTimeSlot], bool]]] = {}
+    open_locations = 0
+    for location in locations_data:
+        slots = parse_time_slots(location.get("times", []))
+        is_open = is_open_at(slots, now_ms)
+        open_locations += is_open
+        cuisine = extract_cuisine_type(location.get("name", "Unknown"), location.get("description", ""))
+        cuisine_groups.setdefault(cuisine, []).append((location, slots, is_open))
 
     # Build markdown
     markdown_parts = [f"# {title}\n"]
 
     # Add summary
     total_locations = len(locations_data)
-    open_locations = sum(1 for loc in locations_data if is_location_open_now(loc.get("times", [])))
 
     markdown_parts.append(f"**{total_locations} locations found** • **{open_locations} currently open**\n")
 
@@ -255,13 +356,11 @@ def format_locations_list_markdown(locations_data: List[Dict[str, Any]], title:
         locations = cuisine_groups[cuisine]
         markdown_parts.append(f"## {cuisine} ({len(locations)})\n")
 
-        for location in locations:
-            # Determine current status
-            is_open = is_location_open_now(location.get("times", []))
+        for location, slots, is_open in locations:
             status = "open" if is_open else "closed"
 
-            location_md = format_location_markdown(location, status)
-            markdown_parts.append(location_md)
+            markdown_parts.extend(_location_markdown_lines(location, status, cuisine, slots))
+            markdown_parts.append("")  # End of the location block
             markdown_parts.append("")  # Add spacing
 
     return "\n".join(markdown_parts)
@@ -1,37 +1,82 @@
+import asyncio
+
 import aiohttp
 from fastmcp import FastMCP
 
+from mcp_server.core.app import on_shutdown
+from mcp_server.services._cache import cached
+
 BASE_URL = "https://rust.api.maps.scottylabs.org"
 TIMEOUT = aiohttp.ClientTimeout(total=10)  # 10 second timeout
+PATH_CACHE_TTL_SECONDS = 60 * 60  # 1h, campus paths rarely change
+SEARCH_CACHE_TTL_SECONDS = 5 * 60  # 5min, queries vary more
 
 app = FastMCP("rust-maps-proxy")
 
+# Shared across all tool calls so pooled connections, DNS lookups and TLS sessions are reused.
+_session: aiohttp.ClientSession | None = None
+
 
 # --- Internal HTTP functions ---
 
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            timeout=TIMEOUT,
+            connector=aiohttp.TCPConnector(ssl=False, limit=100, ttl_dns_cache=300),
+            # The API is stateless, so skip per-request cookie bookkeeping entirely.
+            cookie_jar=aiohttp.DummyCookieJar(),
+        )
+    return _session
+
+
+@on_shutdown
+async def _close_session() -> None:
+    if _session is not None and not _session.closed:
+        await _session.close()
+
+
 async def _search_buildings_http(query: str) -> list[dict]:
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-        async with session.get(f"{BASE_URL}/search", params={"query": query}, ssl=False) as resp:
-            resp.raise_for_status()
-            data = await resp.json()
-            # Normalize to always return a list
-            if isinstance(data, dict):
-                return data.get("results", []) or []
-            elif isinstance(data, list):
-                return data
-            else:
-                return []
+    return await cached(f"maps:search:{query!r}", SEARCH_CACHE_TTL_SECONDS, lambda: _fetch_search_http(query))
 
 
 async def _get_path_http(start_id: str, end_id: str) -> dict:
-    async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-        async with session.get(
-            f"{BASE_URL}/path",
-            params={"start": start_id, "end": end_id},
-            ssl=False
-        ) as resp:
-            resp.raise_for_status()
-            return await resp.json()
+    return await cached(
+        f"maps:path:{(start_id, end_id)!r}", PATH_CACHE_TTL_SECONDS, lambda: _fetch_path_http(start_id, end_id)
+    )
+
+
+async def _fetch_search_http(query: str) -> list[dict]:
+    session = await _get_session()
+    async with session.get(f"{BASE_URL}/search", params={"query": query}) as resp:
+        resp.raise_for_status()
+        data = await resp.json()
+        # Normalize to always return a list
+        if isinstance(data, dict):
+            return data.get("results", []) or []
+        elif isinstance(data, list):
+            return data
+        else:
+            return []
+
+
+async def _fetch_path_http(start_id: str, end_id: str) -> dict:
+    session = await _get_session()
+    async with session.get(
+        f"{BASE_URL}/path",
+        params={"start": start_id, "end": end_id},
+    ) as resp:
+        resp.raise_for_status()
+        return await resp.json()
+
+
+def _path_distance(path: object) -> float:
+    # -1 for anything without a numeric distance, matching distance_between's failure value
+    try:
+        return float(path.get("distance", -1))
+    except (AttributeError, TypeError, ValueError):
+        return -1
 
 
 # --- Tools ---
@@ -66,6 +111,14 @@ async def distance_between(start_id: str, end_id: str) -> float:
         return -1
 
 
+@app.tool()
+async def distances_between(pairs: list[tuple[str, str]]) -> list[float]:
+    """Compute distances in meters for several (start_id, end_id) pairs at once, in input order.
+    Requests run concurrently; a pair that fails yields -1 like distance_between."""
+    paths = await asyncio.gather(*(_get_path_http(start, end) for start, end in pairs), return_exceptions=True)
+    return [_path_distance(p) for p in paths]
+
+
 # @app.tool()
 # async def time_between(start_id: str, end_id: str, speed_m_per_s: float = 1.4) -> float:
 #     """Estimate travel time in seconds between two locations (default walking speed 1.4 m/s)."""